@@ -1,8 +1,8 @@
 """Smart Comfort Climate entity."""
 from __future__ import annotations
 
+import functools
 import logging
-import math
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -12,17 +12,18 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_TEMPERATURE,
-    STATE_UNAVAILABLE,
-    STATE_UNKNOWN,
-    UnitOfTemperature,
-)
-from homeassistant.core import HomeAssistant, callback, Event
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
+from .comfort import (
+    calculate_dew_point,
+    calculate_feels_like_temperature,
+    get_comfort_status,
+)
 from .const import (
+    BAD_STATES,
     CONF_CLIMATE_ENTITY,
     CONF_HUMIDITY_SENSOR,
     CONF_TARGET_FEELS_LIKE,
@@ -43,6 +44,119 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modes for which a setpoint is sent to the underlying climate entity
+_TEMP_SETTABLE_MODES = frozenset({MODE_PRIORITY_COOL, MODE_PRIORITY_DRY})
+
+# Seconds after a command during which climate entity updates are treated
+# as the echo of that command
+_COMMAND_ECHO_WINDOW = 1.0
+
+# Reason codes returned by _decide and their log message templates
+_REASON_HUMID_WARM = 0
+_REASON_HUMID = 1
+_REASON_OPPRESSIVE_HOT = 2
+_REASON_OPPRESSIVE = 3
+_REASON_COOLING_NEEDED = 4
+_REASON_SLIGHT_COOLING = 5
+_REASON_TOO_COLD = 6
+_REASON_PERFECT = 7
+_REASONS = (
+    "AC mode (humidity %.0f%% > %.0f%% target + warm)",
+    "DRY mode (humidity %.0f%% > %.0f%% target)",
+    "AC mode (oppressive dew point + hot)",
+    "DRY mode (oppressive dew point)",
+    "AC mode (good humidity, cooling needed)",
+    "FAN mode (good humidity, slight cooling)",
+    "OFF (good humidity, too cold)",
+    "FAN mode (perfect conditions)",
+)
+
+
+def _parse_state(state: State | None) -> float | None:
+    """Return the numeric value of a sensor state, or None if it has none."""
+    if state is None or state.state in BAD_STATES:
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_comfort_cached(
+    temp_f: float, humidity: float
+) -> tuple[float, float, str]:
+    """Calculate comfort metrics for readings rounded to sensor precision."""
+    return _compute_comfort(temp_f, humidity)
+
+
+def _compute_comfort(temp_f: float, humidity: float) -> tuple[float, float, str]:
+    """Calculate dew point, feels-like temperature and comfort status."""
+    dew_point = calculate_dew_point(temp_f, humidity)
+    feels_like = calculate_feels_like_temperature(temp_f, humidity, dew_point)
+    return dew_point, feels_like, get_comfort_status(dew_point)
+
+
+def _decide(
+    dew_point: float,
+    feels_like_diff: float,
+    current_temp: float,
+    current_humidity: float,
+    target_humidity: float,
+    target_feels_like: float,
+) -> tuple[str, float | None, int, tuple[float, ...]]:
+    """Determine the appropriate climate action with humidity priority.
+
+    Returns the HVAC mode, the setpoint (if any), a reason code indexing
+    _REASONS and the arguments for that reason's template.
+    """
+    # PRIORITY 1: Check if humidity is above target
+    if current_humidity > target_humidity:
+        # Humidity is too high - prioritize dehumidification
+        if feels_like_diff > 2:
+            # Too humid AND too warm - use AC to cool while dehumidifying
+            return (
+                MODE_PRIORITY_COOL,
+                min(current_temp - 2, target_feels_like - 1),
+                _REASON_HUMID_WARM,
+                (current_humidity, target_humidity),
+            )
+        else:
+            # Too humid but temperature manageable - use dry mode
+            return (
+                MODE_PRIORITY_DRY,
+                target_feels_like,
+                _REASON_HUMID,
+                (current_humidity, target_humidity),
+            )
+    
+    # PRIORITY 2: Humidity is acceptable, check dew point for extreme conditions
+    elif dew_point > DEW_POINT_OPPRESSIVE:
+        # Oppressive dew point even if humidity target is met
+        if feels_like_diff > 0:
+            return (
+                MODE_PRIORITY_COOL,
+                min(current_temp - 3, target_feels_like - 2),
+                _REASON_OPPRESSIVE_HOT,
+                (),
+            )
+        else:
+            return MODE_PRIORITY_DRY, target_feels_like, _REASON_OPPRESSIVE, ()
+    
+    # PRIORITY 3: Humidity is good, focus on temperature comfort
+    elif feels_like_diff > 2:
+        # Good humidity but too warm - use AC
+        return MODE_PRIORITY_COOL, current_temp - 1, _REASON_COOLING_NEEDED, ()
+    elif feels_like_diff > 1:
+        # Good humidity, slightly warm - fan only
+        return MODE_PRIORITY_FAN, None, _REASON_SLIGHT_COOLING, ()
+    elif feels_like_diff < -4:
+        # Good humidity but too cold - turn off
+        return MODE_PRIORITY_OFF, None, _REASON_TOO_COLD, ()
+    else:
+        # Perfect conditions - fan only for circulation
+        return MODE_PRIORITY_FAN, None, _REASON_PERFECT, ()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -69,6 +183,35 @@ async def async_setup_entry(
 class SmartComfortClimate(ClimateEntity):
     """Smart Comfort Climate entity."""
 
+    # Only attributes owned by this class; hass and the _attr_* fields are
+    # managed by the Entity base classes and stay in the instance __dict__
+    __slots__ = (
+        "_config_entry",
+        "_climate_entity_id",
+        "_temperature_sensor_id",
+        "_humidity_sensor_id",
+        "_name",
+        "_current_temperature",
+        "_current_humidity",
+        "_feels_like_temperature",
+        "_dew_point",
+        "_comfort_status",
+        "_feels_like_difference",
+        "_humidity_priority",
+        "_hvac_mode",
+        "_is_on",
+        "_underlying_hvac_mode",
+        "_last_inputs",
+        "_last_sent_mode",
+        "_last_sent_temp",
+        "_last_command_time",
+        "_pending_states",
+        "_cached_attrs",
+        "_update_scheduled",
+        "_target_feels_like",
+        "_target_humidity",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -112,27 +255,65 @@ class SmartComfortClimate(ClimateEntity):
         self._feels_like_temperature = None
         self._dew_point = None
         self._comfort_status = None
+        self._feels_like_difference: float | None = None
+        self._humidity_priority = False
         self._hvac_mode = HVACMode.AUTO
         self._is_on = True
         
         # Track underlying climate entity state
         self._underlying_hvac_mode = None
 
-    @property
-    def target_feels_like(self) -> float:
-        """Get the target feels-like temperature from options or config."""
-        return self._config_entry.options.get(
+        # Last raw (temperature, humidity, climate) states seen by the update path
+        self._last_inputs: tuple[str, str, str] | None = None
+
+        # Last commands sent to the underlying climate entity
+        self._last_sent_mode: str | None = None
+        self._last_sent_temp: float | None = None
+        self._last_command_time: float | None = None
+
+        # State changes waiting for the coalesced update
+        self._pending_states: dict[str, State | None] = {}
+        self._update_scheduled = False
+
+        # extra_state_attributes, rebuilt after the values above change
+        self._cached_attrs: dict[str, Any] | None = None
+
+        # Comfort targets resolved from options or config
+        self._target_feels_like: float | None = None
+        self._target_humidity: float | None = None
+        self._refresh_targets()
+
+    def _refresh_targets(self) -> bool:
+        """Resolve the comfort targets from options or config once.
+
+        Returns True if either target changed.
+        """
+        previous = (self._target_feels_like, self._target_humidity)
+        self._target_feels_like = float(self._config_entry.options.get(
             CONF_TARGET_FEELS_LIKE,
             self._config_entry.data.get(CONF_TARGET_FEELS_LIKE, DEFAULT_TARGET_FEELS_LIKE)
-        )
+        ))
+        self._target_humidity = float(self._config_entry.options.get(
+            CONF_TARGET_HUMIDITY,
+            self._config_entry.data.get(CONF_TARGET_HUMIDITY, DEFAULT_TARGET_HUMIDITY)
+        ))
+        self._cached_attrs = None
+        return (self._target_feels_like, self._target_humidity) != previous
+
+    def _reset_sent_commands(self) -> None:
+        """Forget the last commands so the next evaluation re-sends them."""
+        self._last_sent_mode = None
+        self._last_sent_temp = None
+
+    @property
+    def target_feels_like(self) -> float:
+        """Get the target feels-like temperature."""
+        return self._target_feels_like
 
     @property
     def target_humidity(self) -> float:
-        """Get the target humidity from options or config."""
-        return self._config_entry.options.get(
-            CONF_TARGET_HUMIDITY,
-            self._config_entry.data.get(CONF_TARGET_HUMIDITY, DEFAULT_TARGET_HUMIDITY)
-        )
+        """Get the target humidity."""
+        return self._target_humidity
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -160,148 +341,160 @@ class SmartComfortClimate(ClimateEntity):
         await self._async_update_state()
 
     @callback
-    async def _async_state_changed(self, event) -> None:
+    def _async_state_changed(self, event: Event) -> None:
         """Handle state changes of tracked entities."""
-        await self._async_update_state()
-        self.async_write_ha_state()
+        new_state = event.data["new_state"]
+        if (
+            event.data["entity_id"] == self._climate_entity_id
+            and new_state is not None
+            and new_state.state == self._last_sent_mode
+            and self._last_command_time is not None
+            and self.hass.loop.time() - self._last_command_time < _COMMAND_ECHO_WINDOW
+        ):
+            # The climate entity is reporting back the mode we just sent;
+            # mirror it without re-running comfort control. Any other mode
+            # goes through the normal update so the command is corrected
+            self._underlying_hvac_mode = new_state.state
+            self._cached_attrs = None
+            self.async_write_ha_state()
+            return
+
+        # Coalesce events arriving in the same loop iteration (e.g. the
+        # temperature and humidity sensors reporting together) into one update
+        self._pending_states[event.data["entity_id"]] = new_state
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self.hass.loop.call_soon(self._flush_update)
 
     @callback
-    async def _async_config_entry_updated(self, event) -> None:
+    def _flush_update(self) -> None:
+        """Run a single update for all state changes received this iteration."""
+        self._update_scheduled = False
+        pending, self._pending_states = self._pending_states, {}
+        self.hass.async_create_task(self._async_update_state_and_write(pending))
+
+    async def _async_config_entry_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
         """Handle config entry updates."""
-        if event.data["config_entry_id"] == self._config_entry.entry_id:
-            # Config entry was updated, re-evaluate comfort control
+        if entry.entry_id == self._config_entry.entry_id:
+            # Targets already applied, e.g. by async_set_temperature, have
+            # been sent; only re-evaluate comfort control for new targets
+            if not self._refresh_targets():
+                return
+            self._last_inputs = None
+            self._reset_sent_commands()
             await self._async_update_state()
             self.async_write_ha_state()
 
-    async def _async_update_state(self) -> None:
-        """Update the state based on source entities."""
+    async def _async_update_state_and_write(
+        self, new_states: dict[str, State | None] | None = None
+    ) -> None:
+        """Update the state and write it if the readings changed."""
+        if await self._async_update_state(new_states):
+            self.async_write_ha_state()
+
+    async def _async_update_state(
+        self, new_states: dict[str, State | None] | None = None
+    ) -> bool:
+        """Update the state based on source entities.
+
+        States carried by state change events are used for the entities
+        that triggered them; only the other sources are looked up.
+
+        Returns True if the readings changed since the last update.
+        """
         # Get current readings
-        temp_state = self.hass.states.get(self._temperature_sensor_id)
-        humidity_state = self.hass.states.get(self._humidity_sensor_id)
-        climate_state = self.hass.states.get(self._climate_entity_id)
-        
+        new_states = new_states or {}
+        get_state = self.hass.states.get
+        temp_state = new_states.get(self._temperature_sensor_id) or get_state(
+            self._temperature_sensor_id
+        )
+        humidity_state = new_states.get(self._humidity_sensor_id) or get_state(
+            self._humidity_sensor_id
+        )
+        climate_state = new_states.get(self._climate_entity_id) or get_state(
+            self._climate_entity_id
+        )
+
         if not temp_state or not humidity_state or not climate_state:
-            return
-            
-        if temp_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
-            return
-            
-        if humidity_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
-            return
-            
-        try:
-            self._current_temperature = float(temp_state.state)
-            self._current_humidity = float(humidity_state.state)
-        except (ValueError, TypeError):
-            return
+            return False
+
+        # Skip parsing and re-evaluation when none of the raw states changed
+        # (e.g. attribute-only updates such as the climate entity
+        # acknowledging a new setpoint)
+        inputs = (temp_state.state, humidity_state.state, climate_state.state)
+        if inputs == self._last_inputs:
+            return False
+
+        temp_f = _parse_state(temp_state)
+        humidity = _parse_state(humidity_state)
+        if temp_f is None or humidity is None:
+            return False
+        self._last_inputs = inputs
+
+        self._current_temperature = temp_f
+        self._current_humidity = humidity
             
-        # Calculate comfort metrics
-        self._dew_point = self._calculate_dew_point(
-            self._current_temperature, self._current_humidity
-        )
-        self._feels_like_temperature = self._calculate_feels_like_temperature(
-            self._current_temperature, self._current_humidity
+        # Calculate comfort metrics (memoized on readings rounded to 0.1)
+        (
+            self._dew_point,
+            self._feels_like_temperature,
+            self._comfort_status,
+        ) = _compute_comfort_cached(round(temp_f, 1), round(humidity, 1))
+        self._feels_like_difference = round(
+            self._feels_like_temperature - self._target_feels_like, 1
         )
-        self._comfort_status = self._get_comfort_status(self._dew_point)
+        self._humidity_priority = humidity > self._target_humidity
         
-        # Track underlying climate state
+        # Track underlying climate state; a change we did not command means
+        # the device was adjusted elsewhere, so commands must be re-sent
+        if (
+            climate_state.state != self._underlying_hvac_mode
+            and climate_state.state != self._last_sent_mode
+        ):
+            self._reset_sent_commands()
         self._underlying_hvac_mode = climate_state.state
+
+        # Rebuild the attributes from the new readings even if a command
+        # below fails
+        self._cached_attrs = None
         
         # Execute comfort control logic if in auto mode
         if self._hvac_mode == HVACMode.AUTO and self._is_on:
             await self._async_execute_comfort_control()
 
-    def _calculate_dew_point(self, temp_f: float, humidity: float) -> float:
-        """Calculate dew point using Magnus formula."""
-        if humidity <= 0 or humidity > 100:
-            return 0
-            
-        # Convert to Celsius
-        temp_c = (temp_f - 32) * 5 / 9
-        
-        # Magnus formula constants
-        a = 17.625
-        b = 243.04
-        
-        # Calculate dew point
-        alpha = math.log(humidity / 100) + (a * temp_c) / (b + temp_c)
-        dew_point_c = (b * alpha) / (a - alpha)
-        
-        # Convert back to Fahrenheit
-        return (dew_point_c * 9 / 5) + 32
-
-    def _calculate_feels_like_temperature(self, temp_f: float, humidity: float) -> float:
-        """Calculate feels-like temperature (heat index or comfort adjustment)."""
-        if temp_f >= 80 and humidity >= 40:
-            # Use heat index for hot conditions
-            return self._calculate_heat_index(temp_f, humidity)
-        else:
-            # Use dew point adjustment for cooler conditions
-            dew_point = self._calculate_dew_point(temp_f, humidity)
-            if dew_point > 65:
-                return temp_f + (dew_point - 55) * 0.4
-            elif dew_point > 55:
-                return temp_f + (dew_point - 55) * 0.2
-            else:
-                return temp_f
-
-    def _calculate_heat_index(self, temp_f: float, humidity: float) -> float:
-        """Calculate heat index."""
-        hi = (
-            -42.379 + 
-            2.04901523 * temp_f + 
-            10.14333127 * humidity - 
-            0.22475541 * temp_f * humidity - 
-            0.00683783 * temp_f * temp_f - 
-            0.05481717 * humidity * humidity + 
-            0.00122874 * temp_f * temp_f * humidity + 
-            0.00085282 * temp_f * humidity * humidity - 
-            0.00000199 * temp_f * temp_f * humidity * humidity
-        )
-        return hi
-
-    def _get_comfort_status(self, dew_point: float) -> str:
-        """Get comfort status based on dew point."""
-        if dew_point > 65:
-            return "Oppressive"
-        elif dew_point > 60:
-            return "Muggy"
-        elif dew_point > 55:
-            return "Slightly Humid"
-        elif dew_point > 50:
-            return "Comfortable"
-        elif dew_point > 45:
-            return "Very Comfortable"
-        elif dew_point > 35:
-            return "Dry"
-        else:
-            return "Very Dry"
+        return True
 
     async def _async_execute_comfort_control(self) -> None:
         """Execute the comfort control logic."""
-        if not all([
-            self._current_temperature is not None,
-            self._current_humidity is not None,
-            self._feels_like_temperature is not None,
-            self._dew_point is not None,
-        ]):
+        if (
+            self._current_temperature is None
+            or self._current_humidity is None
+            or self._feels_like_temperature is None
+            or self._dew_point is None
+        ):
             return
             
-        target_feels_like = self.target_feels_like
-        target_humidity = self.target_humidity
+        target_feels_like = self._target_feels_like
+        target_humidity = self._target_humidity
         feels_like_diff = self._feels_like_temperature - target_feels_like
         
         # Determine action based on humidity priority and feels-like difference
-        target_mode, target_temp, reason = self._determine_climate_action(
+        target_mode, target_temp, reason_code, reason_args = _decide(
             self._dew_point, 
             feels_like_diff, 
             self._current_temperature,
             self._current_humidity,
-            target_humidity
+            target_humidity,
+            target_feels_like,
         )
         
-        # Execute the action
-        if target_mode != self._underlying_hvac_mode:
+        # Execute the action. The mode is compared with the one the climate
+        # entity reports, so a command it dropped is sent again; only the
+        # setpoint is skipped when it matches the last one sent
+        mode_changed = target_mode != self._underlying_hvac_mode
+        if mode_changed:
             await self.hass.services.async_call(
                 "climate",
                 "set_hvac_mode",
@@ -310,101 +503,35 @@ class SmartComfortClimate(ClimateEntity):
                     "hvac_mode": target_mode,
                 },
             )
-            
-        if target_temp and target_mode in ["cool", "dry"]:
-            await self.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                {
-                    "entity_id": self._climate_entity_id,
-                    "temperature": target_temp,
-                },
-            )
-        
-        # Log the action
-        _LOGGER.info(
-            "%s: %s - Feels like: %.1f°F (target: %.1f°F), Humidity: %.1f%% (target: %.1f%%), Dew point: %.1f°F",
-            self._name,
-            reason,
-            self._feels_like_temperature,
-            target_feels_like,
-            self._current_humidity,
-            target_humidity,
-            self._dew_point,
-        )
+            self._last_sent_mode = target_mode
+            self._last_command_time = self.hass.loop.time()
 
-    def _determine_climate_action(
-        self, 
-        dew_point: float, 
-        feels_like_diff: float, 
-        current_temp: float,
-        current_humidity: float,
-        target_humidity: float
-    ) -> tuple[str, float | None, str]:
-        """Determine the appropriate climate action with humidity priority."""
-        
-        # PRIORITY 1: Check if humidity is above target
-        if current_humidity > target_humidity:
-            # Humidity is too high - prioritize dehumidification
-            if feels_like_diff > 2:
-                # Too humid AND too warm - use AC to cool while dehumidifying
-                return (
-                    MODE_PRIORITY_COOL,
-                    min(current_temp - 2, self.target_feels_like - 1),
-                    f"AC mode (humidity {current_humidity:.0f}% > {target_humidity:.0f}% target + warm)"
-                )
-            else:
-                # Too humid but temperature manageable - use dry mode
-                return (
-                    MODE_PRIORITY_DRY,
-                    self.target_feels_like,
-                    f"DRY mode (humidity {current_humidity:.0f}% > {target_humidity:.0f}% target)"
-                )
-        
-        # PRIORITY 2: Humidity is acceptable, check dew point for extreme conditions
-        elif dew_point > DEW_POINT_OPPRESSIVE:
-            # Oppressive dew point even if humidity target is met
-            if feels_like_diff > 0:
-                return (
-                    MODE_PRIORITY_COOL,
-                    min(current_temp - 3, self.target_feels_like - 2),
-                    "AC mode (oppressive dew point + hot)"
+        if target_temp and target_mode in _TEMP_SETTABLE_MODES:
+            if mode_changed or target_temp != self._last_sent_temp:
+                await self.hass.services.async_call(
+                    "climate",
+                    "set_temperature",
+                    {
+                        "entity_id": self._climate_entity_id,
+                        "temperature": target_temp,
+                    },
                 )
-            else:
-                return (
-                    MODE_PRIORITY_DRY,
-                    self.target_feels_like,
-                    "DRY mode (oppressive dew point)"
-                )
-        
-        # PRIORITY 3: Humidity is good, focus on temperature comfort
-        elif feels_like_diff > 2:
-            # Good humidity but too warm - use AC
-            return (
-                MODE_PRIORITY_COOL,
-                current_temp - 1,
-                "AC mode (good humidity, cooling needed)"
-            )
-        elif feels_like_diff > 1:
-            # Good humidity, slightly warm - fan only
-            return (
-                MODE_PRIORITY_FAN,
-                None,
-                "FAN mode (good humidity, slight cooling)"
-            )
-        elif feels_like_diff < -4:
-            # Good humidity but too cold - turn off
-            return (
-                MODE_PRIORITY_OFF,
-                None,
-                "OFF (good humidity, too cold)"
-            )
+                self._last_sent_temp = target_temp
+                self._last_command_time = self.hass.loop.time()
         else:
-            # Perfect conditions - fan only for circulation
-            return (
-                MODE_PRIORITY_FAN,
-                None,
-                "FAN mode (perfect conditions)"
+            self._last_sent_temp = None
+        
+        # Log the action; the reason is only formatted when it will be emitted
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "%s: %s - Feels like: %.1f°F (target: %.1f°F), Humidity: %.1f%% (target: %.1f%%), Dew point: %.1f°F",
+                self._name,
+                _REASONS[reason_code] % reason_args,
+                self._feels_like_temperature,
+                target_feels_like,
+                self._current_humidity,
+                target_humidity,
+                self._dew_point,
             )
 
     @property
@@ -415,7 +542,7 @@ class SmartComfortClimate(ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature (feels-like)."""
-        return self.target_feels_like
+        return self._target_feels_like
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -425,6 +552,9 @@ class SmartComfortClimate(ClimateEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        if self._cached_attrs is not None:
+            return self._cached_attrs
+
         attrs = {}
         if self._current_temperature is not None:
             attrs["actual_temperature"] = self._current_temperature
@@ -434,13 +564,12 @@ class SmartComfortClimate(ClimateEntity):
             attrs["dew_point"] = round(self._dew_point, 1)
         if self._comfort_status is not None:
             attrs["comfort_status"] = self._comfort_status
-        if self._feels_like_temperature is not None:
-            attrs["feels_like_difference"] = round(
-                self._feels_like_temperature - self.target_feels_like, 1
-            )
+        if self._feels_like_difference is not None:
+            attrs["feels_like_difference"] = self._feels_like_difference
         attrs["underlying_hvac_mode"] = self._underlying_hvac_mode
-        attrs["humidity_priority"] = self._current_humidity > self.target_humidity if self._current_humidity else False
-        attrs["target_humidity"] = self.target_humidity
+        attrs["humidity_priority"] = self._humidity_priority
+        attrs["target_humidity"] = self._target_humidity
+        self._cached_attrs = attrs
         return attrs
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -449,12 +578,12 @@ class SmartComfortClimate(ClimateEntity):
             return
             
         # Update the config entry options with the new target
-        new_options = dict(self._config_entry.options)
-        new_options[CONF_TARGET_FEELS_LIKE] = temperature
-        
         self.hass.config_entries.async_update_entry(
-            self._config_entry, options=new_options
+            self._config_entry,
+            options={**self._config_entry.options, CONF_TARGET_FEELS_LIKE: temperature},
         )
+        self._target_feels_like = float(temperature)
+        self._cached_attrs = None
         
         # Trigger immediate re-evaluation
         if self._hvac_mode == HVACMode.AUTO and self._is_on:
@@ -463,6 +592,7 @@ class SmartComfortClimate(ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         self._hvac_mode = hvac_mode
+        self._reset_sent_commands()
         
         if hvac_mode == HVACMode.OFF:
             self._is_on = False
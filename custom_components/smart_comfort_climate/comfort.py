@@ -0,0 +1,87 @@
+"""Comfort calculations shared by the Smart Comfort Climate platforms."""
+from __future__ import annotations
+
+import bisect
+import math
+
+from .const import (
+    COMFORT_COMFORTABLE,
+    COMFORT_DRY,
+    COMFORT_MUGGY,
+    COMFORT_OPPRESSIVE,
+    COMFORT_SLIGHTLY_HUMID,
+    COMFORT_VERY_COMFORTABLE,
+    COMFORT_VERY_DRY,
+)
+
+# Magnus formula constants
+_MAG_A = 17.625
+_MAG_B = 243.04
+
+# Unit conversion factors
+_F_TO_C = 5.0 / 9.0
+_C_TO_F = 9.0 / 5.0
+_LN_100 = math.log(100.0)
+
+# Comfort status by dew point (°F); each status applies above the threshold
+# before it, so bisect_left keeps boundary values in the lower band
+_DEW_THRESHOLDS = (35, 45, 50, 55, 60, 65)
+_DEW_STATUSES = (
+    COMFORT_VERY_DRY,
+    COMFORT_DRY,
+    COMFORT_VERY_COMFORTABLE,
+    COMFORT_COMFORTABLE,
+    COMFORT_SLIGHTLY_HUMID,
+    COMFORT_MUGGY,
+    COMFORT_OPPRESSIVE,
+)
+
+
+def calculate_dew_point(temp_f: float, humidity: float) -> float:
+    """Calculate dew point using Magnus formula."""
+    if humidity <= 0 or humidity > 100:
+        return 0
+        
+    # Convert to Celsius
+    temp_c = (temp_f - 32) * _F_TO_C
+    
+    # Calculate dew point
+    alpha = math.log(humidity) - _LN_100 + (_MAG_A * temp_c) / (_MAG_B + temp_c)
+    dew_point_c = (_MAG_B * alpha) / (_MAG_A - alpha)
+    
+    # Convert back to Fahrenheit
+    return dew_point_c * _C_TO_F + 32
+
+
+def calculate_feels_like_temperature(
+    temp_f: float, humidity: float, dew_point: float
+) -> float:
+    """Calculate feels-like temperature (heat index or comfort adjustment)."""
+    if temp_f >= 80 and humidity >= 40:
+        # Use heat index for hot conditions
+        return calculate_heat_index(temp_f, humidity)
+    else:
+        # Use dew point adjustment for cooler conditions, i.e.
+        # temp_f + (dew_point - 55) * k with the offset folded to 55 * k
+        if dew_point > 65:
+            return temp_f + 0.4 * dew_point - 22.0
+        elif dew_point > 55:
+            return temp_f + 0.2 * dew_point - 11.0
+        else:
+            return temp_f
+
+
+def calculate_heat_index(temp_f: float, humidity: float) -> float:
+    """Calculate heat index."""
+    # Rothfusz regression grouped as a0(T) + H * (a1(T) + H * a2(T)), with
+    # each coefficient evaluated in Horner form
+    t = temp_f
+    a0 = (-0.00683783 * t + 2.04901523) * t - 42.379
+    a1 = (0.00122874 * t - 0.22475541) * t + 10.14333127
+    a2 = (-0.00000199 * t + 0.00085282) * t - 0.05481717
+    return a0 + humidity * (a1 + humidity * a2)
+
+
+def get_comfort_status(dew_point: float) -> str:
+    """Get comfort status based on dew point."""
+    return _DEW_STATUSES[bisect.bisect_left(_DEW_THRESHOLDS, dew_point)]
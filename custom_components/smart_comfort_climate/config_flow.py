@@ -47,24 +47,6 @@ class SmartComfortClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
             errors["base"] = "invalid_input"
 
-        # Get available entities for selectors
-        climate_entities = [
-            entity_id
-            for entity_id in self.hass.states.async_entity_ids("climate")
-        ]
-        
-        temperature_sensors = [
-            entity_id
-            for entity_id in self.hass.states.async_entity_ids("sensor")
-            if self.hass.states.get(entity_id).attributes.get("device_class") == "temperature"
-        ]
-        
-        humidity_sensors = [
-            entity_id
-            for entity_id in self.hass.states.async_entity_ids("sensor")
-            if self.hass.states.get(entity_id).attributes.get("device_class") == "humidity"
-        ]
-
         data_schema = vol.Schema({
             vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
             vol.Required(CONF_CLIMATE_ENTITY): selector.EntitySelector(
@@ -1,4 +1,5 @@
 """Constants for the Smart Comfort Climate integration."""
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
 DOMAIN = "smart_comfort_climate"
 DEFAULT_NAME = "Smart Comfort Climate"
@@ -21,6 +22,9 @@ DEW_POINT_SLIGHTLY_HUMID = 55
 DEW_POINT_COMFORTABLE = 45
 DEW_POINT_DRY = 35
 
+# Source states that carry no reading
+BAD_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
 # Comfort status strings
 COMFORT_OPPRESSIVE = "Oppressive"
 COMFORT_MUGGY = "Muggy"
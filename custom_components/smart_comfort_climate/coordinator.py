@@ -0,0 +1,127 @@
+"""Shared source tracking for the Smart Comfort Climate sensors."""
+from __future__ import annotations
+
+import asyncio
+import functools
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .comfort import calculate_dew_point
+from .const import BAD_STATES, DOMAIN
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_dew_point_cached(temp_f: float, humidity: float) -> float:
+    """Calculate the dew point, memoized on the readings as reported."""
+    return calculate_dew_point(temp_f, humidity)
+
+
+class ComfortCoordinator:
+    """Track the source sensors of a config entry and share their readings.
+
+    The coordinator subscribes to the temperature and humidity sensors once,
+    parses their states, calculates the dew point and notifies the comfort
+    sensors through the dispatcher, so each source update is handled a
+    single time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        temperature_sensor_id: str,
+        humidity_sensor_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.signal = f"{DOMAIN}_{entry_id}_update"
+        self._temperature_sensor_id = temperature_sensor_id
+        self._humidity_sensor_id = humidity_sensor_id
+        self._get_state = hass.states.get
+        self._unsub: CALLBACK_TYPE | None = None
+        self._flush_handle: asyncio.Handle | None = None
+
+        self.temperature: float | None = None
+        self.humidity: float | None = None
+        self.dew_point: float | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking the source sensors."""
+        self._unsub = async_track_state_change_event(
+            self.hass,
+            [self._temperature_sensor_id, self._humidity_sensor_id],
+            self._async_state_changed,
+        )
+
+        # Initial readings
+        self._update_readings()
+        self._update_dew_point()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking the source sensors."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Handle state changes of the source sensors.
+
+        Temperature and humidity sensors often report together, so changes
+        received in the same loop iteration are handled in one update.
+        """
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush_update)
+
+    @callback
+    def _flush_update(self) -> None:
+        """Update the readings once for all changes received this iteration."""
+        self._flush_handle = None
+        previous = (self.temperature, self.humidity)
+        self._update_readings()
+
+        # Attribute-only changes and repeated values leave the sensors as is
+        if (self.temperature, self.humidity) != previous:
+            self._update_dew_point()
+            async_dispatcher_send(self.hass, self.signal)
+
+    def _update_readings(self) -> None:
+        """Update the readings from the source sensors."""
+        get_state = self._get_state
+        temp_state = get_state(self._temperature_sensor_id)
+        humidity_state = get_state(self._humidity_sensor_id)
+
+        if not temp_state or not humidity_state:
+            return
+
+        if temp_state.state in BAD_STATES:
+            self.temperature = None
+            return
+
+        if humidity_state.state in BAD_STATES:
+            self.humidity = None
+            return
+
+        try:
+            self.temperature = float(temp_state.state)
+            self.humidity = float(humidity_state.state)
+        except (ValueError, TypeError):
+            self.temperature = None
+            self.humidity = None
+
+    def _update_dew_point(self) -> None:
+        """Calculate the dew point shared by the comfort sensors."""
+        if self.temperature is None or self.humidity is None:
+            self.dew_point = None
+        else:
+            self.dew_point = _calculate_dew_point_cached(
+                self.temperature, self.humidity
+            )
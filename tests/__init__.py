@@ -0,0 +1 @@
+"""Tests for the Smart Comfort Climate integration."""
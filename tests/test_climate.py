@@ -0,0 +1,74 @@
+"""Tests for the Smart Comfort Climate entity."""
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+
+from custom_components.smart_comfort_climate.const import (
+    CONF_CLIMATE_ENTITY,
+    CONF_HUMIDITY_SENSOR,
+    CONF_TARGET_FEELS_LIKE,
+    CONF_TARGET_HUMIDITY,
+    CONF_TEMPERATURE_SENSOR,
+    DOMAIN,
+)
+
+
+async def _async_setup_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up an entry tracking a steady room with the AC in cool."""
+    hass.states.async_set("sensor.temperature", "80.1")
+    hass.states.async_set("sensor.humidity", "60")
+    hass.states.async_set("climate.ac", "cool")
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Living Room",
+        data={
+            CONF_CLIMATE_ENTITY: "climate.ac",
+            CONF_TEMPERATURE_SENSOR: "sensor.temperature",
+            CONF_HUMIDITY_SENSOR: "sensor.humidity",
+            CONF_TARGET_FEELS_LIKE: 72.0,
+            CONF_TARGET_HUMIDITY: 45.0,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_setpoint_change_sends_one_command(hass: HomeAssistant) -> None:
+    """A new target feels-like is sent to the climate entity exactly once."""
+    await _async_setup_entry(hass)
+
+    # Replace the climate services registered during setup with mocks
+    set_temperature = async_mock_service(hass, CLIMATE_DOMAIN, "set_temperature")
+    async_mock_service(hass, CLIMATE_DOMAIN, "set_hvac_mode")
+    entity = hass.data[CLIMATE_DOMAIN].get_entity("climate.living_room")
+
+    await entity.async_set_temperature(temperature=74.0)
+    await hass.async_block_till_done()
+
+    assert len(set_temperature) == 1
+    assert set_temperature[0].data == {
+        "entity_id": "climate.ac",
+        "temperature": 73.0,
+    }
+
+
+async def test_options_change_sends_one_command(hass: HomeAssistant) -> None:
+    """Changing the target through the options re-runs comfort control once."""
+    entry = await _async_setup_entry(hass)
+
+    set_temperature = async_mock_service(hass, CLIMATE_DOMAIN, "set_temperature")
+    async_mock_service(hass, CLIMATE_DOMAIN, "set_hvac_mode")
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_TARGET_FEELS_LIKE: 74.0}
+    )
+    await hass.async_block_till_done()
+
+    assert len(set_temperature) == 1
+    assert set_temperature[0].data["temperature"] == 73.0